@@ -3,9 +3,7 @@
 # See LICENSE for details.
 
 
-import getpass
 import os
-import pdb
 import signal
 import sys
 import traceback
@@ -20,7 +18,7 @@ from twisted.application.reactors import NoSuchReactor, installReactor
 from twisted.internet import defer
 from twisted.internet.interfaces import _ISupportsExitSignalCapturing
 from twisted.persisted import sob
-from twisted.python import failure, log, logfile, runtime, usage, util
+from twisted.python import failure, log, runtime, usage, util
 from twisted.python.reflect import namedAny, namedModule, qual
 
 
@@ -231,6 +229,8 @@ class AppLogger:
         if self._logfilename == "-" or not self._logfilename:
             logFile = sys.stdout
         else:
+            from twisted.python import logfile
+
             logFile = logfile.LogFile.fromFullPath(self._logfilename)
         return logger.textFileLogObserver(logFile)
 
@@ -245,6 +245,8 @@ class AppLogger:
 
 
 def fixPdb():
+    import pdb
+
     def do_stop(self, arg):
         self.clear_all_breaks()
         self.set_continue()
@@ -266,10 +268,23 @@ def fixPdb():
     pdb.Pdb.help_stop = help_stop
 
 
+def _startSpewing():
+    """
+    Trace every line executed from now on, in this thread and any thread
+    started later, with L{util.spewer}.
+    """
+    sys.settrace(util.spewer)
+    try:
+        import threading
+    except ImportError:
+        return
+    threading.settrace(util.spewer)
+
+
 def runReactorWithLogging(config, oldstdout, oldstderr, profiler=None, reactor=None):
     """
-    Start the reactor, using profiling if specified by the configuration, and
-    log any error happening in the process.
+    Start the reactor, using profiling or line tracing if specified by the
+    configuration, and log any error happening in the process.
 
     @param config: configuration of the twistd application.
     @type config: L{ServerOptions}
@@ -288,11 +303,15 @@ def runReactorWithLogging(config, oldstdout, oldstderr, profiler=None, reactor=N
     """
     if reactor is None:
         from twisted.internet import reactor
+    if config.get("spew"):
+        _startSpewing()
     try:
         if config["profile"]:
             if profiler is not None:
                 profiler.run(reactor)
         elif config["debug"]:
+            import pdb
+
             sys.stdout = oldstdout
             sys.stderr = oldstderr
             if runtime.platformType == "posix":
@@ -319,6 +338,8 @@ def runReactorWithLogging(config, oldstdout, oldstderr, profiler=None, reactor=N
 
 def getPassphrase(needed):
     if needed:
+        import getpass
+
         return getpass.getpass("Passphrase: ")
     else:
         return None
@@ -439,8 +460,12 @@ class ApplicationRunner:
 
 
 def getApplication(config, passphrase):
-    s = [(config[t], t) for t in ["python", "source", "file"] if config[t]][0]
-    filename, style = s[0], {"file": "pickle"}.get(s[1], s[1])
+    for style in ("python", "source", "file"):
+        filename = config[style]
+        if filename:
+            break
+    if style == "file":
+        style = "pickle"
     try:
         log.msg("Loading %s..." % filename)
         application = service.loadApplication(filename, style, passphrase)
@@ -599,6 +624,7 @@ class ServerOptions(usage.Options, ReactorSelectionMixin):
 
     def __init__(self, *a, **kw):
         self["debug"] = False
+        self["spew"] = False
         if "stdout" in kw:
             self.stdout = kw["stdout"]
         else:
@@ -618,15 +644,11 @@ class ServerOptions(usage.Options, ReactorSelectionMixin):
 
     def opt_spew(self):
         """
-        Print an insanely verbose log of everything that happens.
-        Useful when debugging freezes or locks in complex code.
+        Print an insanely verbose log of everything that happens once the
+        reactor starts.  Useful when debugging freezes or locks in complex
+        code.
         """
-        sys.settrace(util.spewer)
-        try:
-            import threading
-        except ImportError:
-            return
-        threading.settrace(util.spewer)
+        self["spew"] = True
 
     def parseOptions(self, options=None):
         if options is None:
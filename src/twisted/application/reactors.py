@@ -6,6 +6,7 @@
 Plugin-based system for enumerating available reactors and installing one of
 them.
 """
+import sys
 from typing import Iterable, cast
 
 from zope.interface import Attribute, Interface, implementer
@@ -60,7 +61,12 @@ class Reactor:
         self.description = description
 
     def install(self) -> None:
-        namedAny(self.moduleName).install()
+        # Skip the import machinery if the module has already been loaded,
+        # for instance by an application that imported it before choosing it.
+        module = sys.modules.get(self.moduleName)
+        if module is None:
+            module = namedAny(self.moduleName)
+        module.install()
 
 
 def getReactorTypes() -> Iterable[IReactorInstaller]:
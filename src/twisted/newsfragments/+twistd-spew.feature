@@ -0,0 +1 @@
+twistd --spew now starts tracing when the reactor starts running rather than while options are parsed, so loading the application, privilegedStartService and logging setup are no longer traced.
@@ -177,17 +177,20 @@ def loadValueFromFile(filename, variable):
     return value
 
 
+_typesByExtension = {
+    ".tac": "python",
+    ".etac": "python",
+    ".py": "python",
+    ".tap": "pickle",
+    ".etap": "pickle",
+    ".tas": "source",
+    ".etas": "source",
+}
+
+
 def guessType(filename):
     ext = os.path.splitext(filename)[1]
-    return {
-        ".tac": "python",
-        ".etac": "python",
-        ".py": "python",
-        ".tap": "pickle",
-        ".etap": "pickle",
-        ".tas": "source",
-        ".etas": "source",
-    }[ext]
+    return _typesByExtension[ext]
 
 
 __all__ = [
@@ -8,11 +8,12 @@ import inspect
 import os
 import pdb
 import random
+import re
 import sys
 import time
-import trace
 import warnings
-from typing import NoReturn, Optional, Type
+from functools import lru_cache
+from typing import TYPE_CHECKING, NoReturn, Optional, Type
 
 from twisted import plugin
 from twisted.application import app
@@ -24,6 +25,9 @@ from twisted.trial import itrial, runner
 from twisted.trial._dist.disttrial import DistTrialRunner
 from twisted.trial.unittest import TestSuite
 
+if TYPE_CHECKING:
+    import trace
+
 # Yea, this is stupid.  Leave it for command-line compatibility for a
 # while, though.
 TBFORMAT_MAP = {
@@ -69,6 +73,12 @@ def _autoJobs() -> int:
     return number
 
 
+_localVariablesDeclaration = re.compile(r"-\*-(.*)-\*-")
+
+# How much of a file loadLocalVariables reads looking for a declaration.
+_localVariablesReadSize = 512
+
+
 def _parseLocalVariables(line):
     """
     Accepts a single line in Emacs local variable declaration format and
@@ -77,20 +87,17 @@ def _parseLocalVariables(line):
 
     See http://www.gnu.org/software/emacs/manual/html_node/File-Variables.html
     """
-    paren = "-*-"
-    start = line.find(paren) + len(paren)
-    end = line.rfind(paren)
-    if start == -1 or end == -1:
+    match = _localVariablesDeclaration.search(line)
+    if match is None:
         raise ValueError(f"{line!r} not a valid local variable declaration")
-    items = line[start:end].split(";")
     localVars = {}
-    for item in items:
-        if len(item.strip()) == 0:
+    for item in match.group(1).split(";"):
+        if not item.strip():
             continue
-        split = item.split(":")
-        if len(split) != 2:
+        name, separator, value = item.partition(":")
+        if not separator or ":" in value:
             raise ValueError(f"{line!r} contains invalid declaration {item!r}")
-        localVars[split[0].strip()] = split[1].strip()
+        localVars[name.strip()] = value.strip()
     return localVars
 
 
@@ -101,8 +108,18 @@ def loadLocalVariables(filename):
 
     See http://www.gnu.org/software/emacs/manual/html_node/File-Variables.html
     """
-    with open(filename) as f:
-        lines = [f.readline(), f.readline()]
+    with open(filename, buffering=_localVariablesReadSize) as f:
+        # Emacs only looks at the first two lines, which are short in any
+        # file we care about, so read a bounded amount in one go rather than
+        # line by line, through a buffer no bigger than that.
+        lines = f.read(_localVariablesReadSize).split("\n", 2)
+        if len(lines) < 3:
+            # The read ended before the second line did; finish reading the
+            # lines it cut short.
+            lines[-1] += f.readline()
+            if len(lines) < 2:
+                lines.append(f.readline())
+        lines = lines[:2]
     for line in lines:
         try:
             return _parseLocalVariables(line)
@@ -118,13 +135,14 @@ def getTestModules(filename):
     return testCaseVar.split(",")
 
 
+@lru_cache(maxsize=4096)
 def isTestFile(filename):
     """
     Returns true if 'filename' looks like a file containing unit tests.
     False otherwise.  Doesn't care whether filename exists.
     """
     basename = os.path.basename(filename)
-    return basename.startswith("test_") and os.path.splitext(basename)[1] == (".py")
+    return basename.startswith("test_") and basename.endswith(".py")
 
 
 def _reporterAction():
@@ -268,10 +286,11 @@ class _BasicOptions:
         ],
     )
 
-    tracer: Optional[trace.Trace] = None
+    tracer: Optional["trace.Trace"] = None
 
     def __init__(self):
         self["tests"] = []
+        self._testsSet = set()
         usage.Options.__init__(self)
 
     def getSynopsis(self):
@@ -311,6 +330,8 @@ class _BasicOptions:
         Generate coverage information in the coverage file in the
         directory specified by the temp-directory option.
         """
+        import trace
+
         self.tracer = trace.Trace(count=1, trace=0)
         sys.settrace(self.tracer.globaltrace)
         self["coverage"] = True
@@ -334,9 +355,9 @@ class _BasicOptions:
             return
         filename = os.path.abspath(filename)
         if isTestFile(filename):
-            self["tests"].append(filename)
+            self._addTests([filename])
         else:
-            self["tests"].extend(getTestModules(filename))
+            self._addTests(getTestModules(filename))
 
     def opt_spew(self):
         """
@@ -426,13 +447,26 @@ class _BasicOptions:
             sys.modules[module] = None
 
     def parseArgs(self, *args):
-        self["tests"].extend(args)
+        self._addTests(args)
+
+    def _addTests(self, tests):
+        """
+        Add names to the list of tests to run, skipping any which are already
+        in it.
+
+        @param tests: The names of the tests to add.
+        @type tests: iterable of L{str}
+        """
+        for test in tests:
+            if test not in self._testsSet:
+                self._testsSet.add(test)
+                self["tests"].append(test)
 
     def _loadReporterByName(self, name):
         for p in plugin.getPlugins(itrial.IReporter):
-            qual = f"{p.module}.{p.klass}"
             if p.longOpt == name:
-                return reflect.namedAny(qual)
+                # Only the chosen reporter is imported.
+                return reflect.namedAny(f"{p.module}.{p.klass}")
         raise usage.UsageError(
             "Only pass names of Reporter plugins to "
             "--reporter. See --help-reporters for "
@@ -10,6 +10,8 @@ L{twisted.persisted.sob}.
 import copy
 import os
 import pickle
+import subprocess
+import sys
 from io import StringIO
 
 try:
@@ -27,6 +29,7 @@ from twisted.persisted import sob
 from twisted.plugins import twisted_reactors
 from twisted.protocols import basic, wire
 from twisted.python import usage
+from twisted.python.reflect import ModuleNotFound
 from twisted.python.runtime import platformType
 from twisted.python.test.modules_helpers import TwistedModulesMixin
 from twisted.trial.unittest import SkipTest, TestCase
@@ -257,6 +260,22 @@ class AppSupportTests(TestCase):
     def testPassphrase(self):
         self.assertIsNone(app.getPassphrase(0))
 
+    def test_optionalModulesNotImportedEagerly(self):
+        """
+        Importing L{twisted.application.app} does not import L{pdb},
+        L{getpass} or L{twisted.python.logfile}, which are only needed for
+        C{--debug}, encrypted applications and C{--logfile} respectively.
+        """
+        script = (
+            "import sys\n"
+            "import twisted.application.app\n"
+            "modules = {'pdb', 'getpass', 'twisted.python.logfile'}\n"
+            "print(sorted(modules & set(sys.modules)))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", script], env=env)
+        self.assertEqual(output.strip(), b"[]")
+
     def testLoadApplication(self):
         """
         Test loading an application file in different dump format.
@@ -282,6 +301,22 @@ class AppSupportTests(TestCase):
         a1 = app.getApplication(config, None)
         self.assertEqual(service.IService(a1).name, "hello")
 
+    def test_loadApplicationPrefersPython(self):
+        """
+        L{app.getApplication} loads the application from the C{python} option
+        when it is given, even though C{file} always has a default value.
+        """
+        with open("hello.tac", "w") as f:
+            f.writelines(
+                [
+                    "from twisted.application import service\n",
+                    "application = service.Application('hello')\n",
+                ]
+            )
+        config = {"file": "twistd.tap", "source": None, "python": "hello.tac"}
+        a1 = app.getApplication(config, None)
+        self.assertEqual(service.IService(a1).name, "hello")
+
     def test_convertStyle(self):
         appl = service.Application("lala")
         for instyle in "source pickle".split():
@@ -757,6 +792,36 @@ class PluggableReactorTests(TwistedModulesMixin, TestCase):
         installer.install()
         self.assertEqual(installed, [True])
 
+    def test_reactorInstallationAlreadyImported(self):
+        """
+        L{reactors.Reactor.install} uses its module straight from
+        L{sys.modules} if it has already been imported, without going through
+        L{reactors.namedAny}.
+        """
+        installed = []
+
+        def install():
+            installed.append(True)
+
+        def namedAny(name):
+            self.fail(f"namedAny({name!r}) called for an imported module")
+
+        fakeReactor = FakeReactor(install, "fakereactortest", __name__, "described")
+        self.replaceSysModules({"fakereactortest": fakeReactor})
+        self.patch(reactors, "namedAny", namedAny)
+        installer = reactors.Reactor("fakereactor", "fakereactortest", "described")
+        installer.install()
+        self.assertEqual(installed, [True])
+
+    def test_reactorInstallationUnimportable(self):
+        """
+        L{reactors.Reactor.install} raises L{ModuleNotFound} if its module has
+        been blocked in L{sys.modules}.
+        """
+        self.replaceSysModules({"fakereactortest": None})
+        installer = reactors.Reactor("fakereactor", "fakereactortest", "described")
+        self.assertRaises(ModuleNotFound, installer.install)
+
     def test_installReactor(self):
         """
         Test that the L{reactors.installReactor} function correctly installs
@@ -12,6 +12,7 @@ import os
 import pickle
 import signal
 import sys
+import threading
 
 try:
     import grp as _grp
@@ -366,6 +367,34 @@ class ServerOptionsTests(TestCase):
 
         self.assertRaises(UsageError, config.parseOptions, ["web --foo"])
 
+    def test_spew(self):
+        """
+        C{--spew} is recorded in the options but does not start tracing while
+        the command line is still being parsed.
+        """
+        traces = []
+        self.patch(sys, "settrace", traces.append)
+        self.patch(threading, "settrace", traces.append)
+        config = twistd.ServerOptions()
+        self.assertFalse(config["spew"])
+        config.parseOptions(["--spew"])
+        self.assertTrue(config["spew"])
+        self.assertEqual(traces, [])
+
+    def test_reactorsNotDiscoveredForUsage(self):
+        """
+        Neither C{--version} nor the usage message look up the available
+        reactors; that only happens for C{--help-reactors}.
+        """
+
+        def getReactorTypes():
+            self.fail("Reactor types were looked up.")
+
+        config = twistd.ServerOptions(stdout=StringIO())
+        config._getReactorTypes = getReactorTypes
+        self.assertRaises(SystemExit, config.parseOptions, ["--version"])
+        self.assertIn("--help-reactors", str(config))
+
 
 @skipIf(not _twistd_unix, "twistd unix not available")
 class CheckPIDTests(TestCase):
@@ -672,6 +701,27 @@ class ApplicationRunnerTests(TestCase):
         runner.startReactor(reactor, None, None)
         self.assertTrue(reactor.called, "startReactor did not call reactor.run()")
 
+    def test_startReactorSpews(self):
+        """
+        L{startReactor} installs L{util.spewer} as the trace function for this
+        and future threads before running the reactor if C{spew} is set.
+        """
+        events = []
+        self.patch(sys, "settrace", lambda f: events.append(("sys", f)))
+        self.patch(threading, "settrace", lambda f: events.append(("threading", f)))
+
+        class RecordingReactor:
+            def run(self):
+                events.append("run")
+
+        runner = app.ApplicationRunner(
+            {"profile": False, "profiler": "profile", "debug": False, "spew": True}
+        )
+        runner.startReactor(RecordingReactor(), None, None)
+        self.assertEqual(
+            events, [("sys", util.spewer), ("threading", util.spewer), "run"]
+        )
+
     def test_applicationRunnerChoosesReactorIfNone(self):
         """
         L{ApplicationRunner} chooses a reactor if none is specified.
@@ -13,6 +13,7 @@ import os
 import sys
 from functools import partial
 from os.path import isabs
+from threading import Thread
 from typing import (
     Any,
     Awaitable,
@@ -114,6 +115,9 @@ class StartedWorkerPool:
 
     @ivar ampWorkers: AMP protocol instances corresponding to the worker child
         processes.
+
+    @ivar testDirRemover: The thread removing the previous contents of the
+        working directory, or L{None} if there was nothing to remove.
     """
 
     workingDirectory: FilePath[Any]
@@ -121,6 +125,7 @@ class StartedWorkerPool:
     testLog: TextIO
     workers: List[LocalWorker]
     ampWorkers: List[LocalWorkerAMP]
+    testDirRemover: Optional[Thread] = None
 
     _logger = Logger()
 
@@ -151,6 +156,8 @@ class StartedWorkerPool:
         del self.ampWorkers[:]
         self.testLog.close()
         self.testDirLock.unlock()
+        if self.testDirRemover is not None:
+            self.testDirRemover.join()
 
 
 @frozen
@@ -220,7 +227,7 @@ class WorkerPool:
 
         @return: A started pool object that can run jobs using the workers.
         """
-        testDir, testDirLock = _unusedTestDirectory(
+        testDir, testDirLock, testDirRemover = _unusedTestDirectory(
             self._config.workingDirectory,
         )
 
@@ -252,6 +259,7 @@ class WorkerPool:
             testLog,
             workers,
             ampWorkers,
+            testDirRemover,
         )
 
 
@@ -23,6 +23,7 @@ from hamcrest import (
     equal_to,
     has_length,
     none,
+    not_none,
     starts_with,
 )
 from hamcrest.core.core.allof import AllOf
@@ -325,6 +326,33 @@ class WorkerPoolTests(TestCase):
         assert_that(started.testLog.closed, equal_to(True))
         assert_that(started.testDirLock.locked, equal_to(False))
 
+    def test_joinRemovesOldDirectory(self):
+        """
+        If the working directory was left by an earlier run, the thread
+        removing its old contents has finished once L{StartedWorkerPool.join}
+        is done.
+        """
+        self.workingDirectory.makedirs()
+        self.workingDirectory.child("_trial_marker").touch()
+        self.workingDirectory.child("test.log").setContent(b"log")
+
+        reactor = CountingReactor([])
+        started = self.successResultOf(self.pool.start(reactor))
+        remover = started.testDirRemover
+        assert_that(remover, not_none())
+        joining = Deferred.fromCoroutine(started.join())
+        for w in reactor._workers:
+            for fd in w.transport._closed:
+                w.childConnectionLost(fd)
+            for f in [w.processExited, w.processEnded]:
+                f(Failure(ProcessDone(0)))
+        self.successResultOf(joining)
+        assert_that(remover.is_alive(), equal_to(False))
+        assert_that(
+            [name for name in self.parent.listdir() if "_old" in name],
+            equal_to([]),
+        )
+
     @given(
         booleans(),
         sampled_from(
@@ -0,0 +1 @@
+trial now moves the previous run's _trial_temp directory aside and removes it in a background thread while the tests run, instead of removing it before the run starts. Tests which call os.fork() while that removal is still going on get a DeprecationWarning about forking a multi-threaded process on Python 3.12 and later.
@@ -0,0 +1 @@
+trial --profile now profiles with cProfile instead of the pure-Python profile module, which slows the tests down much less; the printed statistics and the profile.data file written by the C profiler can still be read with pstats.
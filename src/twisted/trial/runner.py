@@ -798,14 +798,18 @@ def _testDirectory(workingDirectory: str) -> Generator[None, None, None]:
         directory to acquire.
     """
     currentDir = os.getcwd()
-    base = filepath.FilePath(workingDirectory)
-    testdir, testDirLock = util._unusedTestDirectory(base)
+    # Join onto the directory we already have rather than letting FilePath
+    # look up the current directory again to make the path absolute.
+    base = filepath.FilePath(os.path.join(currentDir, workingDirectory))
+    testdir, testDirLock, remover = util._unusedTestDirectory(base)
     os.chdir(testdir.path)
 
     yield
 
     os.chdir(currentDir)
     testDirLock.unlock()
+    if remover is not None:
+        remover.join()
 
 
 @contextmanager
@@ -951,14 +955,12 @@ class TrialRunner:
                 result.addSuccess(single)
                 result.stopTest(single)
         else:
-            if self.mode == self.DEBUG:
-                assert self.debugger is not None
-                run = lambda: self.debugger.runcall(suite.run, result)
-            else:
-                run = lambda: suite.run(result)
-
             with _testDirectory(self.workingDirectory), _logFile(self.logfile):
-                run()
+                if self.mode == self.DEBUG:
+                    assert self.debugger is not None
+                    self.debugger.runcall(suite.run, result)
+                else:
+                    suite.run(result)
 
         result.done()
         return result
@@ -167,6 +167,25 @@ class TrialRunnerTests(TrialRunnerTestsMixin, unittest.SynchronousTestCase):
         self.runner = runner.TrialRunner(CapturingReporter, stream=self.stream)
         self.test = TrialRunnerTests("test_empty")
 
+    def test_suiteRunDirectly(self):
+        """
+        L{runner.TrialRunner.run} runs its suite straight from
+        C{_runWithoutDecoration}, with no helper frames in between for
+        profiles or tracebacks to show.
+        """
+        callers = []
+
+        class RecordingSuite:
+            def __init__(self, tests, forceGarbageCollection):
+                pass
+
+            def run(self, result):
+                callers.append(sys._getframe(1).f_code.co_name)
+
+        self.patch(runner, "TrialSuite", RecordingSuite)
+        self.runner.run(self.test)
+        self.assertEqual(callers, ["_runWithoutDecoration"])
+
     def test_publisher(self):
         """
         The reporter constructed by L{runner.TrialRunner} is passed
@@ -1027,6 +1046,50 @@ class QualifiedNameWalkerTests(unittest.SynchronousTestCase):
         )
 
 
+class TestDirectoryTests(unittest.SynchronousTestCase):
+    """
+    Tests for L{twisted.trial.runner._testDirectory}.
+    """
+
+    def test_relativeToCurrentDirectory(self):
+        """
+        C{_testDirectory} enters a working directory named relative to the
+        current directory, looking the current directory up only once, and
+        returns to the current directory afterwards.
+        """
+        currentDir = os.getcwd()
+        name = self.mktemp()
+        calls = []
+        getcwd = os.getcwd
+
+        def countingGetcwd():
+            calls.append(None)
+            return getcwd()
+
+        self.patch(os, "getcwd", countingGetcwd)
+        with runner._testDirectory(name):
+            inside = getcwd()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(inside, os.path.join(currentDir, name))
+        self.assertEqual(getcwd(), currentDir)
+
+    def test_oldDirectoryRemovedOnExit(self):
+        """
+        If the working directory was left by an earlier run, its old contents
+        have been removed by the time C{_testDirectory} exits.
+        """
+        workingDirectory = FilePath(self.mktemp())
+        with runner._testDirectory(workingDirectory.path):
+            FilePath("test.log").setContent(b"log")
+        with runner._testDirectory(workingDirectory.path):
+            pass
+        self.assertEqual(workingDirectory.listdir(), ["_trial_marker"])
+        self.assertEqual(
+            [name for name in workingDirectory.parent().listdir() if "_old" in name],
+            [],
+        )
+
+
 class TrialMainDoesNothingTests(unittest.SynchronousTestCase):
     """
     Importing L{twisted.trial.__main__} will not run the script
@@ -5,25 +5,28 @@ from __future__ import annotations
 import gc
 import os
 import re
+import subprocess
 import sys
 import textwrap
 import types
 from io import StringIO
-from typing import List
+from typing import Any, List, NoReturn, cast
 from unittest import skipIf
 
 from hamcrest import assert_that, contains_string
 from hypothesis import given
 from hypothesis.strategies import sampled_from
 
+from twisted import plugin
 from twisted.logger import Logger
-from twisted.python import util
+from twisted.python import reflect, usage, util
 from twisted.python.filepath import FilePath, IFilePath
 from twisted.python.usage import UsageError
 from twisted.scripts import trial
-from twisted.trial import unittest
+from twisted.trial import reporter, unittest
 from twisted.trial._dist.disttrial import DistTrialRunner
 from twisted.trial._dist.functional import compose
+from twisted.trial.itrial import IReporter
 from twisted.trial.runner import (
     DestructiveTestSuite,
     TestLoader,
@@ -267,6 +270,39 @@ class TestModuleTests(unittest.SynchronousTestCase):
             trial._getSuite(self.config), ["twisted.trial.test.test_log"]
         )
 
+    def test_testmoduleTwiceNamedOnce(self) -> None:
+        """
+        When the same module is specified with two --testmodule flags, its
+        name is only added to the tests option once.
+        """
+        self.config.opt_testmodule(sibpath("moduletest.py"))
+        self.config.opt_testmodule(sibpath("moduletest.py"))
+        self.assertEqual(self.config["tests"], ["twisted.trial.test.test_log"])
+
+    def test_duplicateArguments(self) -> None:
+        """
+        Tests named more than once on the command line are only added to the
+        tests option once, in the order they were first given.
+        """
+        self.config.parseOptions(["foo", "bar", "foo", "baz", "bar"])
+        self.assertEqual(self.config["tests"], ["foo", "bar", "baz"])
+
+    def test_argumentsNotStatted(self) -> None:
+        """
+        Positional arguments are recorded as given, without looking them up
+        in the filesystem; the loader decides later whether they are paths.
+        """
+
+        def noStat(*args: object, **kwargs: object) -> NoReturn:
+            raise AssertionError("parseArgs should not touch the filesystem")
+
+        self.patch(os, "stat", noStat)
+        self.patch(os.path, "exists", noStat)
+        self.config.parseArgs("twisted.trial.test", os.path.join("a", "b.py"))
+        self.assertEqual(
+            self.config["tests"], ["twisted.trial.test", os.path.join("a", "b.py")]
+        )
+
     def test_testmoduleOnSourceAndTarget(self) -> None:
         """
         If --testmodule is specified twice, once for module A and once for
@@ -365,6 +401,15 @@ class TestModuleTests(unittest.SynchronousTestCase):
     def test_invalidLine(self) -> None:
         self.assertRaises(ValueError, trial._parseLocalVariables, "foo")
 
+    def test_unterminatedDeclaration(self) -> None:
+        """
+        A line with only an opening C{-*-} is not a local variable
+        declaration.
+        """
+        self.assertRaises(
+            ValueError, trial._parseLocalVariables, "# -*- test-case-name: foo"
+        )
+
     def test_invalidDeclaration(self) -> None:
         self.assertRaises(ValueError, trial._parseLocalVariables, "-*- foo -*-")
         self.assertRaises(
@@ -393,6 +438,30 @@ class TestModuleTests(unittest.SynchronousTestCase):
             localVars,
         )
 
+    def test_variablesOnSecondLine(self) -> None:
+        """
+        L{trial.loadLocalVariables} finds a declaration on the second line of
+        a file, but not on the third.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"#!/usr/bin/env python\n# -*- test-case-name: foo -*-\n")
+        self.assertEqual({"test-case-name": "foo"}, trial.loadLocalVariables(path.path))
+        path.setContent(b"\n\n# -*- test-case-name: foo -*-\n")
+        self.assertEqual({}, trial.loadLocalVariables(path.path))
+
+    def test_variablesAfterLongFirstLine(self) -> None:
+        """
+        L{trial.loadLocalVariables} finds a declaration on the second line of
+        a file even if the first line is longer than the single read it
+        normally makes, and still ignores the third line.
+        """
+        path = FilePath(self.mktemp())
+        firstLine = b"x = 1  # " + b"a" * 600 + b"\n"
+        path.setContent(firstLine + b"# -*- test-case-name: foo -*-\n")
+        self.assertEqual({"test-case-name": "foo"}, trial.loadLocalVariables(path.path))
+        path.setContent(firstLine + b"\n# -*- test-case-name: foo -*-\n")
+        self.assertEqual({}, trial.loadLocalVariables(path.path))
+
     def test_getTestModules(self) -> None:
         modules = trial.getTestModules(sibpath("moduletest.py"))
         self.assertEqual(modules, ["twisted.trial.test.test_log"])
@@ -418,12 +487,25 @@ class TestModuleTests(unittest.SynchronousTestCase):
             "twisted/trial/test/moduletest.py",
             sibpath("scripttest.py"),
             sibpath("test_foo.bat"),
+            "twisted/trial/test/test_script.py.orig",
+            "twisted/trial/test_dir/moduletest.py",
         ]:
             self.assertFalse(
                 trial.isTestFile(filename),
                 f"{filename!r} should *not* be a test file",
             )
 
+    def test_looksLikeTestModuleRepeated(self) -> None:
+        """
+        Asking L{trial.isTestFile} about the same filename again gives the same
+        answer, from its cache.
+        """
+        filename = sibpath("test_script.py")
+        self.assertTrue(trial.isTestFile(filename))
+        hits = trial.isTestFile.cache_info().hits
+        self.assertTrue(trial.isTestFile(filename))
+        self.assertEqual(trial.isTestFile.cache_info().hits, hits + 1)
+
 
 class WithoutModuleTests(unittest.SynchronousTestCase):
     """
@@ -587,6 +669,39 @@ class CoverageTests(unittest.SynchronousTestCase):
             options.tracer.globaltrace,
         )
 
+    def test_traceNotImportedEagerly(self) -> None:
+        """
+        Importing L{twisted.scripts.trial} does not import L{trace}, which is
+        only needed for C{"--coverage"}.
+        """
+        script = (
+            "import sys\n"
+            "import twisted.scripts.trial\n"
+            "print('trace' in sys.modules)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", script], env=env)
+        self.assertEqual(output.strip(), b"False")
+
+    def test_linesCounted(self) -> None:
+        """
+        Lines executed after C{"--coverage"} is handled are counted by the
+        tracer against the file they are in.
+        """
+
+        def covered() -> int:
+            return 1
+
+        options = trial.Options()
+        options.parseOptions(["--coverage"])
+        covered()
+        sys.settrace(None)
+        assert options.tracer is not None
+        code = covered.__code__
+        self.assertIn(
+            (code.co_filename, code.co_firstlineno + 1), options.tracer.counts
+        )
+
     def test_coverdirDefault(self) -> None:
         """
         L{trial.Options.coverdir} returns a L{FilePath} based on the default
@@ -690,6 +805,50 @@ class OptionsTests(unittest.TestCase):
         )
         self.assertEqual("You can't specify --random when using --order", str(error))
 
+    def test_reportersNotLookedUpForHelp(self) -> None:
+        """
+        Neither creating the options nor asking them for C{--help} looks up the
+        reporter plugins.
+        """
+
+        def noPlugins(interface: object) -> NoReturn:
+            raise AssertionError("reporter plugins should not be looked up")
+
+        self.patch(plugin, "getPlugins", noPlugins)
+        self.patch(sys, "stdout", StringIO())
+        options = trial.Options()
+        self.assertRaises(SystemExit, options.parseOptions, ["--help"])
+
+    def test_onlyChosenReporterLoaded(self) -> None:
+        """
+        Only the reporter named by C{--reporter} is resolved from its plugin.
+        """
+        loaded: list[str] = []
+        namedAny = reflect.namedAny
+
+        def recordingNamedAny(name: str) -> object:
+            loaded.append(name)
+            return namedAny(name)
+
+        self.patch(reflect, "namedAny", recordingNamedAny)
+        self.options.parseOptions(["--reporter", "text"])
+        self.assertEqual(loaded, ["twisted.trial.reporter.TextReporter"])
+        self.assertIs(self.options["reporter"], reporter.TextReporter)
+
+    def test_reporterCompletionsDeferred(self) -> None:
+        """
+        The shell completions for C{--reporter} are only computed when they
+        are asked for, and list the long names of the reporter plugins.
+        """
+        action = trial.Options.compData.optActions["reporter"]
+        self.assertTrue(callable(action))
+        completer = action()
+        self.assertIsInstance(completer, usage.CompleteList)
+        # The plugins found are the IPlugin objects describing the reporters,
+        # not IReporter providers, so their longOpt is not in the interface.
+        reporters = plugin.getPlugins(IReporter)
+        self.assertEqual(completer._items, [cast(Any, p).longOpt for p in reporters])
+
 
 class MakeRunnerTests(unittest.TestCase):
     """
@@ -1027,6 +1186,42 @@ class OrderTests(unittest.TestCase):
         )
 
 
+class RandomTests(unittest.TestCase):
+    """
+    Tests for the --random option.
+    """
+
+    def loadShuffled(self, seed: str) -> list[str]:
+        """
+        Load L{twisted.trial.test.ordertests} in the order given by C{seed}.
+        """
+        config = trial.Options()
+        config.parseOptions(["--random", seed, "twisted.trial.test.ordertests"])
+        self.patch(sys, "stdout", StringIO())
+        loader = trial._getLoader(config)
+        return testNames(loader.loadByNames(config["tests"]))
+
+    def test_seedReproducible(self) -> None:
+        """
+        --random orders the tests the same way each time it is given the same
+        seed.
+        """
+        self.assertEqual(self.loadShuffled("1234"), self.loadShuffled("1234"))
+
+    def test_shuffled(self) -> None:
+        """
+        --random runs the same tests as a normal run, in an order depending on
+        the seed.
+        """
+        config = trial.Options()
+        config.parseOptions(["twisted.trial.test.ordertests"])
+        names = testNames(trial._getLoader(config).loadByNames(config["tests"]))
+        orders = [self.loadShuffled(seed) for seed in ("1", "2", "3")]
+        for order in orders:
+            self.assertEqual(sorted(order), sorted(names))
+        self.assertGreater(len({tuple(order) for order in orders}), 1)
+
+
 class HelpOrderTests(unittest.TestCase):
     """
     Tests for the --help-orders flag.
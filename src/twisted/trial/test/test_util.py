@@ -366,6 +366,32 @@ class JanitorTests(SynchronousTestCase):
         self.assertEqual(reporter.errors[0][1].value.selectables, [repr(selectable)])
 
 
+class ProfiledTests(SynchronousTestCase):
+    """
+    Tests for L{util.profiled}.
+    """
+
+    def test_profiled(self) -> None:
+        """
+        L{util.profiled} wraps a function so that calling the wrapper returns
+        the function's result, writes profile data loadable by L{pstats} to the
+        given file, and prints the collected statistics.
+        """
+        import pstats
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        output = self.mktemp()
+        stdout = StringIO()
+        self.patch(sys, "stdout", stdout)
+        self.assertEqual(util.profiled(add, output)(1, b=2), 3)
+        self.assertIn("function calls", stdout.getvalue())
+        saved = StringIO()
+        pstats.Stats(output, stream=saved).print_stats()
+        self.assertIn(f"({add.__code__.co_name})", saved.getvalue())
+
+
 class RemoveSafelyTests(SynchronousTestCase):
     """
     Tests for L{util._removeSafely}.
@@ -451,6 +477,89 @@ class RemoveSafelyTests(SynchronousTestCase):
         self.assertIn("could not remove FilePath", out.getvalue())
 
 
+class RemoveSafelyInBackgroundTests(SynchronousTestCase):
+    """
+    Tests for L{util._removeSafelyInBackground}.
+    """
+
+    def makeTrialDirectory(self) -> filepath.FilePath[bytes]:
+        """
+        Make a directory marked as a trial temporary directory, holding a file.
+        """
+        dirPath = filepath.FilePath(self.mktemp().encode("utf-8"))
+        dirPath.makedirs()
+        dirPath.child(b"_trial_marker").touch()
+        dirPath.child(b"test.log").setContent(b"log")
+        return dirPath
+
+    def test_noTrialMarker(self) -> None:
+        """
+        If a path doesn't contain a node named C{"_trial_marker"}, that path is
+        not moved or removed by L{util._removeSafelyInBackground} and a
+        L{util._NoTrialMarker} exception is raised instead.
+        """
+        dirPath = filepath.FilePath(self.mktemp().encode("utf-8"))
+        dirPath.makedirs()
+        self.assertRaises(util._NoTrialMarker, util._removeSafelyInBackground, dirPath)
+        self.assertTrue(dirPath.isdir())
+
+    def test_removedInBackground(self) -> None:
+        """
+        L{util._removeSafelyInBackground} frees the path's name before
+        returning, and removes the renamed directory in the thread it returns.
+        """
+        dirPath = self.makeTrialDirectory()
+        before = set(dirPath.parent().children())
+        remover = util._removeSafelyInBackground(dirPath)
+        assert remover is not None
+        self.assertFalse(remover.daemon)
+        self.assertFalse(dirPath.exists())
+        remover.join()
+        self.assertEqual(set(dirPath.parent().children()), before - {dirPath})
+
+    def test_moveFails(self) -> None:
+        """
+        If the path cannot be renamed, L{util._removeSafelyInBackground}
+        removes it before returning.
+        """
+
+        def dummyMoveTo(destination: object, followLinks: bool = True) -> None:
+            raise OSError("path movement failed")
+
+        dirPath = self.makeTrialDirectory()
+        dirPath.moveTo = dummyMoveTo  # type: ignore[method-assign]
+        self.assertIsNone(util._removeSafelyInBackground(dirPath))
+        self.assertFalse(dirPath.exists())
+
+
+class UnusedTestDirectoryTests(SynchronousTestCase):
+    """
+    Tests for L{util._unusedTestDirectory}.
+    """
+
+    def test_existingDirectoryReplaced(self) -> None:
+        """
+        If the test directory left by an earlier run exists,
+        L{util._unusedTestDirectory} returns a new, empty, marked directory in
+        its place, and the thread removing the old one.
+        """
+        base = filepath.FilePath(self.mktemp())
+        testdir, lock, remover = util._unusedTestDirectory(base)
+        lock.unlock()
+        self.assertIsNone(remover)
+        testdir.child("test.log").setContent(b"log")
+
+        testdir, lock, remover = util._unusedTestDirectory(base)
+        self.addCleanup(lock.unlock)
+        assert remover is not None
+        remover.join()
+        self.assertEqual(testdir, base)
+        self.assertEqual(testdir.listdir(), ["_trial_marker"])
+        self.assertEqual(
+            [name for name in base.parent().listdir() if "_old" in name], []
+        )
+
+
 class ExcInfoTests(SynchronousTestCase):
     """
     Tests for L{excInfoOrFailureToExcInfo}.
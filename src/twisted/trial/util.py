@@ -20,6 +20,7 @@ Maintainer: Jonathan Lange
 from __future__ import annotations
 
 from random import randrange
+from threading import Thread
 from typing import Any, Callable, TextIO, TypeVar
 
 from typing_extensions import ParamSpec
@@ -249,9 +250,9 @@ _T = TypeVar("_T")
 
 def profiled(f: Callable[_P, _T], outputFile: str) -> Callable[_P, _T]:
     def _(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-        import profile
+        import cProfile
 
-        prof = profile.Profile()
+        prof = cProfile.Profile()
         try:
             result = prof.runcall(f, *args, **kwargs)
             prof.dump_stats(outputFile)
@@ -303,6 +304,42 @@ def _removeSafely(path):
             raise
 
 
+def _removeSafelyInBackground(path):
+    """
+    Safely remove a path, recursively, without waiting for the removal.
+
+    As with L{_removeSafely}, if C{path} does not contain a node named
+    C{_trial_marker}, a L{_NoTrialMarker} exception is raised and the path is
+    not removed.  Otherwise C{path} is renamed to a sibling, freeing its name
+    at once, and the sibling is removed by L{_removeSafely} in a new thread.
+    If the rename fails, C{path} is removed by L{_removeSafely} before this
+    returns.
+
+    The removing thread is not a daemon thread, so the process does not exit
+    until the removal is finished.
+
+    @return: The thread removing the renamed path, or L{None} if the path was
+        removed before returning.
+    @rtype: L{Thread} or L{None}
+    """
+    if not path.child(b"_trial_marker").exists():
+        raise _NoTrialMarker(
+            f"{path!r} is not a trial temporary path, refusing to remove it"
+        )
+    oldPath = path.siblingExtension(b"_old" + str(randrange(10000000)).encode("utf-8"))
+    try:
+        path.moveTo(oldPath)
+    except OSError:
+        _removeSafely(path)
+        return None
+
+    remover = Thread(
+        target=_removeSafely, args=(oldPath,), name=f"trial removing {oldPath.path!r}"
+    )
+    remover.start()
+    return remover
+
+
 class _WorkingDirectoryBusy(Exception):
     """
     A working directory was specified to the runner, but another test run is
@@ -322,12 +359,15 @@ def _unusedTestDirectory(base):
         basename will be used instead.
     @type base: L{FilePath}
 
-    @return: A two-tuple.  The first element is a L{FilePath} representing the
-        directory which was found and created.  The second element is a locked
-        L{FilesystemLock<twisted.python.lockfile.FilesystemLock>}.  Another
-        call to C{_unusedTestDirectory} will not be able to reused the
+    @return: A three-tuple.  The first element is a L{FilePath} representing
+        the directory which was found and created.  The second element is a
+        locked L{FilesystemLock<twisted.python.lockfile.FilesystemLock>}.
+        Another call to C{_unusedTestDirectory} will not be able to reused the
         same name until the lock is released, either explicitly or by this
-        process exiting.
+        process exiting.  The third element is the L{Thread} removing the
+        previous contents of the directory, which the caller should join once
+        it is done with the directory, or L{None} if there was nothing left to
+        remove.
     """
     counter = 0
     while True:
@@ -340,15 +380,16 @@ def _unusedTestDirectory(base):
         testDirLock = FilesystemLock(testdir.path + ".lock")
         if testDirLock.lock():
             # It is not in use
+            remover = None
             if testdir.exists():
-                # It exists though - delete it
-                _removeSafely(testdir)
+                # It exists though - delete it, without holding up the run.
+                remover = _removeSafelyInBackground(testdir)
 
             # Create it anew and mark it as ours so the next _removeSafely on
             # it succeeds.
             testdir.makedirs()
             testdir.child(b"_trial_marker").setContent(b"")
-            return testdir, testDirLock
+            return testdir, testDirLock, remover
         else:
             # It is in use
             if base.basename() == "_trial_temp":
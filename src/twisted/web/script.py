@@ -8,11 +8,13 @@ I contain PythonScript, which is a very simple python script resource.
 
 
 import os
-import traceback
-from io import StringIO
+import stat
+from collections import OrderedDict
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, Tuple, Union
 
-from twisted import copyright
-from twisted.python.compat import execfile, networkString
+from twisted.python.compat import networkString
 from twisted.python.filepath import _coerceToFilesystemEncoding
 from twisted.web import http, resource, server, static, util
 
@@ -27,6 +29,81 @@ resource = mygreatresource.MyGreatResource()
 """
 
 
+# Compiled scripts, keyed by the function which compiled them and their path,
+# along with the modification time and size of the file they were compiled
+# from.  Ordered from least to most recently used so that the oldest entries
+# can be evicted once there are more than _codeCacheSize of them.
+_CodeCacheKey = Tuple[Callable[[Any], CodeType], Union[str, bytes]]
+_codeCache: "OrderedDict[_CodeCacheKey, Tuple[Tuple[int, int], CodeType]]" = (
+    OrderedDict()
+)
+_codeCacheSize = 256
+
+
+def _compilePython(path):
+    """
+    Compile the Python source file at C{path}.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    return compile(source, path, "exec")
+
+
+def _compileTemplate(path):
+    """
+    Compile the Quixote PTL template at C{path}.
+    """
+    from quixote import ptl_compile
+
+    with open(path) as f:  # Not closed by quixote as of 2.9.1
+        e = ptl_compile.compile_template(f, path)
+    return compile(e, "<source>", "exec")
+
+
+def _compileScript(path, compileFile=_compilePython):
+    """
+    Compile the file at C{path}, reusing the code object from a previous call
+    if the file has not been modified since.
+
+    @param path: The filesystem path of the script.
+    @type path: L{bytes} or L{str}
+
+    @param compileFile: A callable which takes C{path} and returns its
+        compiled code.  By default the file is compiled as Python source.
+
+    @raise OSError: If the file cannot be read.
+
+    @return: The compiled module-level code of the script.
+    @rtype: L{types.CodeType}
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (compileFile, path)
+    cached = _codeCache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _codeCache.move_to_end(key)
+        return cached[1]
+    code = compileFile(path)
+    _codeCache[key] = (stamp, code)
+    _codeCache.move_to_end(key)
+    while len(_codeCache) > _codeCacheSize:
+        _codeCache.popitem(last=False)
+    return code
+
+
+@lru_cache(maxsize=256)
+def _scriptFile(path):
+    """
+    Convert the path of a script to the text form given to it as C{__file__}.
+
+    @param path: The filesystem path of the script.
+    @type path: L{bytes} or L{str}
+
+    @rtype: L{str}
+    """
+    return _coerceToFilesystemEncoding("", path)
+
+
 class AlreadyCached(Exception):
     """
     This exception is raised when a path has already been cached.
@@ -51,6 +128,10 @@ class CacheScanner:
 
 noRsrc = resource._UnsafeErrorPage(500, "Whoops! Internal Error", rpyNoResource)
 
+# The initial globals shared by every .rpy script and PTL template.  Copying
+# this is cheaper than building a new dict from scratch for each request.
+_scriptGlobals: Dict[str, object] = {"resource": noRsrc}
+
 
 def ResourceScript(path, registry):
     """
@@ -59,15 +140,13 @@ def ResourceScript(path, registry):
     renderred.
     """
     cs = CacheScanner(path, registry)
-    glob = {
-        "__file__": _coerceToFilesystemEncoding("", path),
-        "resource": noRsrc,
-        "registry": registry,
-        "cache": cs.cache,
-        "recache": cs.recache,
-    }
+    glob = _scriptGlobals.copy()
+    glob["__file__"] = _scriptFile(path)
+    glob["registry"] = registry
+    glob["cache"] = cs.cache
+    glob["recache"] = cs.recache
     try:
-        execfile(path, glob, glob)
+        exec(_compileScript(path), glob, glob)
     except AlreadyCached as ac:
         return ac.args[0]
     rsrc = glob["resource"]
@@ -77,20 +156,10 @@ def ResourceScript(path, registry):
 
 
 def ResourceTemplate(path, registry):
-    from quixote import ptl_compile
-
-    glob = {
-        "__file__": _coerceToFilesystemEncoding("", path),
-        "resource": resource._UnsafeErrorPage(
-            500, "Whoops! Internal Error", rpyNoResource
-        ),
-        "registry": registry,
-    }
-
-    with open(path) as f:  # Not closed by quixote as of 2.9.1
-        e = ptl_compile.compile_template(f, path)
-    code = compile(e, "<source>", "exec")
-    eval(code, glob, glob)
+    glob = _scriptGlobals.copy()
+    glob["__file__"] = _scriptFile(path)
+    glob["registry"] = registry
+    eval(_compileScript(path, _compileTemplate), glob, glob)
     return glob["resource"]
 
 
@@ -116,6 +185,8 @@ class ResourceScriptDirectory(resource.Resource):
     be served using L{ResourceScript}.  Directory children will be served using
     another L{ResourceScriptDirectory}.
 
+    @cvar childNotFound: L{Resource} used to render 404 Not Found error pages.
+
     @ivar path: A C{str} giving the filesystem path in which children will be
         looked up.
 
@@ -123,6 +194,8 @@ class ResourceScriptDirectory(resource.Resource):
         how to interpret scripts found as children of this resource.
     """
 
+    childNotFound: resource.Resource = resource._UnsafeNoResource()
+
     def __init__(self, pathname, registry=None):
         resource.Resource.__init__(self)
         self.path = pathname
@@ -131,14 +204,18 @@ class ResourceScriptDirectory(resource.Resource):
     def getChild(self, path, request):
         fn = os.path.join(self.path, path)
 
-        if os.path.isdir(fn):
-            return ResourceScriptDirectory(fn, self.registry)
-        if os.path.exists(fn):
-            return ResourceScript(fn, self.registry)
-        return resource._UnsafeNoResource()
+        try:
+            st = os.stat(fn)
+        except (OSError, ValueError):
+            return self.childNotFound
+        if stat.S_ISDIR(st.st_mode):
+            child = ResourceScriptDirectory(fn, self.registry)
+            child.childNotFound = self.childNotFound
+            return child
+        return ResourceScript(fn, self.registry)
 
     def render(self, request):
-        return resource._UnsafeNoResource().render(request)
+        return self.childNotFound.render(request)
 
 
 class PythonScript(resource.Resource):
@@ -151,6 +228,12 @@ class PythonScript(resource.Resource):
 
     isLeaf = True
 
+    # The value of the X-Powered-By header, computed on first render.
+    # Subclasses may set this to send something else.
+    _poweredBy = None
+
+    _notFound = resource._UnsafeNoResource("File not found.")
+
     def __init__(self, filename, registry):
         """
         Initialize me with a script name.
@@ -167,27 +250,26 @@ class PythonScript(resource.Resource):
         will NOT be handled with print - standard output goes to the log - but
         with request.write.
         """
-        request.setHeader(
-            b"x-powered-by", networkString("Twisted/%s" % copyright.version)
-        )
+        cls = type(self)
+        if cls._poweredBy is None:
+            from twisted import copyright
+
+            cls._poweredBy = networkString("Twisted/%s" % copyright.version)
+        request.setHeader(b"x-powered-by", cls._poweredBy)
         namespace = {
             "request": request,
-            "__file__": _coerceToFilesystemEncoding("", self.filename),
+            "__file__": _scriptFile(self.filename),
             "registry": self.registry,
         }
         try:
-            execfile(self.filename, namespace, namespace)
+            exec(_compileScript(self.filename), namespace, namespace)
         except OSError as e:
             if e.errno == 2:  # file not found
                 request.setResponseCode(http.NOT_FOUND)
-                request.write(
-                    resource._UnsafeNoResource("File not found.").render(request)
-                )
+                request.write(self._notFound.render(request))
         except BaseException:
-            io = StringIO()
-            traceback.print_exc(file=io)
-            output = util._PRE(io.getvalue())
-            output = output.encode("utf8")
-            request.write(output)
+            import traceback
+
+            request.write(util._PRE(traceback.format_exc()).encode("utf8"))
         request.finish()
         return server.NOT_DONE_YET
@@ -6,16 +6,223 @@ Tests for L{twisted.web.script}.
 """
 
 import os
+from types import CodeType
 
+from twisted import copyright
 from twisted.internet import defer
 from twisted.python.filepath import FilePath
 from twisted.trial.unittest import TestCase
+from twisted.web import script, static
 from twisted.web.http import NOT_FOUND
-from twisted.web.script import PythonScript, ResourceScriptDirectory
+from twisted.web.resource import Resource
+from twisted.web.script import (
+    PythonScript,
+    ResourceScript,
+    ResourceScriptDirectory,
+    ResourceScriptWrapper,
+)
 from twisted.web.test._util import _render
 from twisted.web.test.requesthelper import DummyRequest
 
 
+class CompileScriptTests(TestCase):
+    """
+    Tests for L{twisted.web.script._compileScript}.
+    """
+
+    def setUp(self) -> None:
+        self.patch(script, "_codeCache", script.OrderedDict())
+        self.script = FilePath(self.mktemp())
+        self.script.setContent(b"x = 1")
+
+    def test_compiles(self) -> None:
+        """
+        L{_compileScript} returns the compiled module-level code of the script.
+        """
+        namespace: dict[str, object] = {}
+        exec(script._compileScript(self.script.path), namespace)
+        self.assertEqual(namespace["x"], 1)
+
+    def test_unmodifiedReused(self) -> None:
+        """
+        Compiling a script which has not changed since the last call returns
+        the same code object.
+        """
+        first = script._compileScript(self.script.path)
+        self.assertIs(script._compileScript(self.script.path), first)
+
+    def test_modifiedRecompiled(self) -> None:
+        """
+        Compiling a script which has changed since the last call compiles the
+        new source.
+        """
+        script._compileScript(self.script.path)
+        self.script.setContent(b"x = 200")
+        namespace: dict[str, object] = {}
+        exec(script._compileScript(self.script.path), namespace)
+        self.assertEqual(namespace["x"], 200)
+
+    def test_missing(self) -> None:
+        """
+        Compiling a script which does not exist raises L{FileNotFoundError}.
+        """
+        self.assertRaises(FileNotFoundError, script._compileScript, self.mktemp())
+
+    def test_leastRecentlyUsedEvicted(self) -> None:
+        """
+        Once more scripts than C{_codeCacheSize} have been compiled, the least
+        recently used one is dropped from the cache.
+        """
+        self.patch(script, "_codeCacheSize", 2)
+        other = FilePath(self.mktemp())
+        other.setContent(b"")
+        another = FilePath(self.mktemp())
+        another.setContent(b"")
+        script._compileScript(self.script.path)
+        script._compileScript(other.path)
+        script._compileScript(self.script.path)
+        script._compileScript(another.path)
+        self.assertEqual(
+            list(script._codeCache),
+            [
+                (script._compilePython, self.script.path),
+                (script._compilePython, another.path),
+            ],
+        )
+
+    def test_compileFile(self) -> None:
+        """
+        L{_compileScript} compiles the file with the given C{compileFile}
+        callable, caching its result separately from other ways of compiling
+        the same file.
+        """
+        calls: list[str] = []
+
+        def compileFile(path: str) -> CodeType:
+            calls.append(path)
+            return compile("x = 2", path, "exec")
+
+        first = script._compileScript(self.script.path, compileFile)
+        self.assertIs(script._compileScript(self.script.path, compileFile), first)
+        self.assertEqual(calls, [self.script.path])
+        namespace: dict[str, object] = {}
+        exec(script._compileScript(self.script.path), namespace)
+        self.assertEqual(namespace["x"], 1)
+
+
+class ResourceScriptTests(TestCase):
+    """
+    Tests for L{ResourceScript}.
+    """
+
+    def makeScript(self, source: bytes) -> str:
+        """
+        Write an rpy script.
+
+        @param source: The source of the script.
+
+        @return: The path of the script.
+        """
+        path: FilePath[str] = FilePath(self.mktemp())
+        path.setContent(
+            b"from twisted.web.resource import Resource\n"
+            + source
+            + b"\nresource = Resource()\n"
+        )
+        return path.path
+
+    def test_cache(self) -> None:
+        """
+        A script which calls C{cache()} is only run the first time it is
+        loaded with a given registry; afterwards the resource it created is
+        returned.
+        """
+        path = self.makeScript(b"cache()")
+        registry = static.Registry()
+        first = ResourceScript(path, registry)
+        self.assertIs(registry.getCachedPath(path), first)
+        self.assertIs(ResourceScript(path, registry), first)
+        self.assertIsNot(ResourceScript(path, static.Registry()), first)
+
+    def test_recache(self) -> None:
+        """
+        A script which calls C{recache()} is run every time it is loaded, and
+        the resource it created most recently is cached.
+        """
+        path = self.makeScript(b"recache()")
+        registry = static.Registry()
+        first = ResourceScript(path, registry)
+        second = ResourceScript(path, registry)
+        self.assertIsNot(first, second)
+        self.assertIs(registry.getCachedPath(path), second)
+
+    def test_noCache(self) -> None:
+        """
+        A script which calls neither C{cache()} nor C{recache()} is run every
+        time it is loaded, and nothing is cached.
+        """
+        path = self.makeScript(b"")
+        registry = static.Registry()
+        self.assertIsNot(ResourceScript(path, registry), ResourceScript(path, registry))
+        self.assertIsNone(registry.getCachedPath(path))
+
+    def test_file(self) -> None:
+        """
+        A script loaded from a L{bytes} path sees its path as text in
+        C{__file__}.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"registry.file = __file__")
+        registry = static.Registry()
+        ResourceScript(path._asBytesPath(), registry)
+        self.assertEqual(registry.file, path._asTextPath())  # type: ignore[attr-defined]
+
+    def test_noResource(self) -> None:
+        """
+        A script which does not assign to C{resource} produces an error page,
+        which is not cached even if the script calls C{cache()}.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"cache()")
+        registry = static.Registry()
+        self.assertIs(ResourceScript(path.path, registry), script.noRsrc)
+        self.assertIsNone(registry.getCachedPath(path.path))
+
+
+class ResourceScriptWrapperTests(TestCase):
+    """
+    Tests for L{ResourceScriptWrapper}.
+    """
+
+    def test_runPerRequest(self) -> defer.Deferred[None]:
+        """
+        L{ResourceScriptWrapper} runs a script which does not call C{cache()}
+        for every request, so the script can produce a different resource
+        each time.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(
+            b"""
+from twisted.web.static import Data
+registry.runs.append(None)
+resource = Data(b"%d" % len(registry.runs), "text/plain")
+"""
+        )
+        registry = static.Registry()
+        registry.runs = []  # type: ignore[attr-defined]
+        wrapper = ResourceScriptWrapper(path.path, registry)
+        requests = [DummyRequest([b""]), DummyRequest([b""])]
+        d = defer.gatherResults([_render(wrapper, r) for r in requests])
+
+        def cbRendered(ignored: object) -> None:
+            self.assertEqual(
+                [b"".join(r.written) for r in requests],
+                [b"1", b"2"],
+            )
+
+        return d.addCallback(cbRendered)
+
+
 class ResourceScriptDirectoryTests(TestCase):
     """
     Tests for L{ResourceScriptDirectory}.
@@ -54,6 +261,52 @@ class ResourceScriptDirectoryTests(TestCase):
 
         return d.addCallback(cbRendered)
 
+    def test_notFoundShared(self) -> None:
+        """
+        L{ResourceScriptDirectory.getChild} returns C{childNotFound} for a
+        missing child, and directory children inherit it.
+        """
+        tmp = FilePath(self.mktemp())
+        tmp.child("sub").makedirs()
+        notFound = Resource()
+        resource = ResourceScriptDirectory(tmp.path)
+        resource.childNotFound = notFound
+        self.assertIs(resource.getChild("foo", DummyRequest([b"foo"])), notFound)
+        child = resource.getChild("sub", DummyRequest([b"sub"]))
+        self.assertIs(child.getChild("foo", DummyRequest([b"foo"])), notFound)
+
+    def test_directoryChild(self) -> None:
+        """
+        L{ResourceScriptDirectory.getChild} returns another
+        L{ResourceScriptDirectory}, sharing the same registry, for a child
+        which is a directory.
+        """
+        tmp = FilePath(self.mktemp())
+        tmp.child("sub").makedirs()
+        resource = ResourceScriptDirectory(tmp.path)
+        child = resource.getChild("sub", DummyRequest([b"sub"]))
+        self.assertIsInstance(child, ResourceScriptDirectory)
+        self.assertEqual(child.path, tmp.child("sub").path)
+        self.assertIs(child.registry, resource.registry)
+
+    def test_deletedChild(self) -> None:
+        """
+        L{ResourceScriptDirectory.getChild} returns the not-found resource for
+        a child which has been deleted since it was last looked up, even if
+        the directory's modification time did not change.
+        """
+        tmp = FilePath(self.mktemp())
+        tmp.makedirs()
+        tmp.child("a.rpy").setContent(b"")
+        resource = ResourceScriptDirectory(tmp.path)
+        resource.getChild("a.rpy", DummyRequest([b"a.rpy"]))
+        mtime = os.stat(tmp.path).st_mtime_ns
+        tmp.child("a.rpy").remove()
+        os.utime(tmp.path, ns=(mtime, mtime))
+        request = DummyRequest([b"a.rpy"])
+        resource.getChild("a.rpy", request).render(request)
+        self.assertEqual(request.responseCode, NOT_FOUND)
+
     def test_render(self) -> defer.Deferred[None]:
         """
         L{ResourceScriptDirectory.getChild} returns a resource which renders a
@@ -119,3 +372,78 @@ class PythonScriptTests(TestCase):
             self.assertIn(b"nooo", b"".join(request.written))
 
         return d.addCallback(cbRendered)
+
+    def test_poweredByHeader(self) -> defer.Deferred[None]:
+        """
+        L{PythonScript.render} sets the I{X-Powered-By} response header to the
+        running Twisted version.
+        """
+        self.patch(PythonScript, "_poweredBy", None)
+        tmp = FilePath(self.mktemp())
+        tmp.makedirs()
+        child = tmp.child("test.epy")
+        child.setContent(b"request.write(b'ok')")
+        resource = PythonScript(child._asBytesPath(), None)
+        request = DummyRequest([b""])
+        d = _render(resource, request)
+
+        def cbRendered(ignored: object) -> None:
+            self.assertEqual(
+                request.responseHeaders.getRawHeaders(b"x-powered-by"),
+                [b"Twisted/" + copyright.version.encode("ascii")],
+            )
+            self.assertEqual(b"".join(request.written), b"ok")
+
+        return d.addCallback(cbRendered)
+
+    def test_poweredByHeaderComputedOnce(self) -> defer.Deferred[None]:
+        """
+        L{PythonScript.render} computes the I{X-Powered-By} header value once
+        and sends the same L{bytes} object for every later request.
+        """
+        self.patch(PythonScript, "_poweredBy", None)
+        tmp = FilePath(self.mktemp())
+        tmp.makedirs()
+        child = tmp.child("test.epy")
+        child.setContent(b"")
+        resource = PythonScript(child._asBytesPath(), None)
+        requests = [DummyRequest([b""]), DummyRequest([b""])]
+        d = defer.gatherResults([_render(resource, r) for r in requests])
+
+        def cbRendered(ignored: object) -> None:
+            values = []
+            for r in requests:
+                headers = r.responseHeaders.getRawHeaders(b"x-powered-by")
+                assert headers is not None
+                values.append(headers[0])
+            first, second = values
+            self.assertEqual(first, b"Twisted/" + copyright.version.encode("ascii"))
+            self.assertIs(first, second)
+            self.assertIs(PythonScript._poweredBy, first)
+
+        return d.addCallback(cbRendered)
+
+    def test_poweredByHeaderOverride(self) -> defer.Deferred[None]:
+        """
+        A subclass of L{PythonScript} can replace the value of the
+        I{X-Powered-By} header by setting C{_poweredBy}.
+        """
+
+        class CustomScript(PythonScript):
+            _poweredBy = b"Something/1.0"
+
+        tmp = FilePath(self.mktemp())
+        tmp.makedirs()
+        child = tmp.child("test.epy")
+        child.setContent(b"")
+        resource = CustomScript(child._asBytesPath(), None)
+        request = DummyRequest([b""])
+        d = _render(resource, request)
+
+        def cbRendered(ignored: object) -> None:
+            self.assertEqual(
+                request.responseHeaders.getRawHeaders(b"x-powered-by"),
+                [b"Something/1.0"],
+            )
+
+        return d.addCallback(cbRendered)